@@ -49,6 +49,7 @@ from .validation import (
     Severity,
     ValidationMessage,
     ValidationResult,
+    worm_wheel_clearance,
 )
 
 from .check_mesh import (
@@ -137,6 +138,7 @@ __all__ = [
     "Severity",
     "ValidationMessage",
     "ValidationResult",
+    "worm_wheel_clearance",
 
     # Kinematic mesh compatibility (Phase 1 of #191)
     "MeshReport",
@@ -233,6 +233,11 @@ def calculate_globoid_throat_radii(
     For a globoid worm, the throat (waist) radius is sized to contact
     the wheel at the correct center distance.
 
+    Only ``+``, ``-`` and ``/`` are used, so NumPy arrays can be passed for
+    any argument to evaluate a whole design sweep in one call (results
+    broadcast elementwise). The calculator itself stays NumPy-free so it
+    keeps running in Pyodide.
+
     Args:
         centre_distance_mm: Center distance between axes (mm)
         wheel_pitch_diameter_mm: Wheel pitch diameter (mm)
@@ -4,7 +4,42 @@ JSON Schema validation for wormgear design format.
 Validates the structure and types of wormgear JSON documents
 according to schema v1.0.
 """
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+
+
+# Schema v1.0 field specs, built once at import and shared by every call
+_NUMERIC = (int, float)
+
+# Sentinel for absent keys, so each field costs a single dict lookup
+_MISSING = object()
+
+_REQUIRED_SECTIONS = ('worm', 'wheel', 'assembly')
+
+_WORM_REQUIRED_NUMERIC = (
+    'module_mm', 'num_starts', 'pitch_diameter_mm', 'tip_diameter_mm',
+    'root_diameter_mm', 'lead_mm', 'lead_angle_deg', 'addendum_mm',
+    'dedendum_mm', 'thread_thickness_mm',
+)
+_WORM_OPTIONAL_NUMERIC = ('throat_curvature_radius_mm', 'profile_shift', 'length_mm')
+
+_WHEEL_REQUIRED_NUMERIC = (
+    'module_mm', 'num_teeth', 'pitch_diameter_mm', 'tip_diameter_mm',
+    'root_diameter_mm', 'throat_diameter_mm', 'helix_angle_deg',
+    'addendum_mm', 'dedendum_mm',
+)
+_WHEEL_OPTIONAL_NUMERIC = ('profile_shift', 'width_mm')
+
+_ASSEMBLY_REQUIRED_NUMERIC = ('centre_distance_mm', 'pressure_angle_deg', 'backlash_mm', 'ratio')
+_ASSEMBLY_OPTIONAL_SCALAR = ('efficiency', 'self_locking')
+
+_MANUFACTURING_OPTIONAL_NUMERIC = ('worm_length', 'wheel_width', 'hobbing_steps')
+
+# Enum value sets (hashed membership via _is_choice; messages spell the
+# choices out)
+_VALID_HANDS = frozenset({'right', 'left'})
+_VALID_PROFILES = frozenset({'ZA', 'ZK', 'ZI'})
+_VALID_WORM_TYPES = frozenset({'cylindrical', 'globoid'})
+_VALID_ANTI_ROTATION = frozenset({'none', 'DIN6885', 'DD-cut'})
 
 
 class ValidationError(Exception):
@@ -29,8 +64,7 @@ def validate_design_json(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         return False, ["Root must be a JSON object/dict"]
 
     # Validate required top-level sections
-    required_sections = ['worm', 'wheel', 'assembly']
-    for section in required_sections:
+    for section in _REQUIRED_SECTIONS:
         if section not in data:
             errors.append(f"Missing required section: '{section}'")
         elif not isinstance(data[section], dict):
@@ -70,92 +104,79 @@ def validate_design_json(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
-def _validate_worm_section(worm: Dict[str, Any]) -> List[str]:
-    """Validate worm section structure."""
-    errors = []
-
-    # Required numeric fields
-    required_numeric = [
-        'module_mm', 'num_starts', 'pitch_diameter_mm', 'tip_diameter_mm',
-        'root_diameter_mm', 'lead_mm', 'lead_angle_deg', 'addendum_mm',
-        'dedendum_mm', 'thread_thickness_mm'
-    ]
-    for field in required_numeric:
-        if field not in worm:
+def _check_required_numeric(
+    section: Dict[str, Any],
+    fields: Tuple[str, ...],
+    errors: List[str],
+) -> None:
+    """Append errors for missing or non-numeric required fields."""
+    for field in fields:
+        value = section.get(field, _MISSING)
+        if value is _MISSING:
             errors.append(f"missing required field '{field}'")
-        elif not isinstance(worm[field], (int, float)):
-            errors.append(f"'{field}' must be numeric, got {type(worm[field]).__name__}")
+        elif not isinstance(value, _NUMERIC):
+            errors.append(f"'{field}' must be numeric, got {type(value).__name__}")
+
+
+def _check_optional_numeric(
+    section: Dict[str, Any],
+    fields: Tuple[str, ...],
+    errors: List[str],
+) -> None:
+    """Append errors for optional fields that are present but non-numeric."""
+    for field in fields:
+        value = section.get(field)
+        if value is not None and not isinstance(value, _NUMERIC):
+            errors.append(f"'{field}' must be numeric, got {type(value).__name__}")
+
 
-    # Required string fields
-    if 'hand' not in worm:
+def _is_choice(value: Any, choices: FrozenSet[str]) -> bool:
+    """Return True if value is one of the allowed strings.
+
+    The isinstance check comes first so list/dict values from malformed
+    JSON are reported as invalid instead of raising on the hash lookup.
+    """
+    return isinstance(value, str) and value in choices
+
+
+def _check_hand(section: Dict[str, Any], errors: List[str]) -> None:
+    """Append an error if the required 'hand' field is missing or invalid."""
+    if 'hand' not in section:
         errors.append("missing required field 'hand'")
-    elif worm['hand'] not in ['right', 'left']:
-        errors.append(f"'hand' must be 'right' or 'left', got '{worm['hand']}'")
+    elif not _is_choice(section['hand'], _VALID_HANDS):
+        errors.append(f"'hand' must be 'right' or 'left', got '{section['hand']}'")
 
-    # Optional numeric fields
-    optional_numeric = ['throat_curvature_radius_mm', 'profile_shift', 'length_mm']
-    for field in optional_numeric:
-        if field in worm and worm[field] is not None:
-            if not isinstance(worm[field], (int, float)):
-                errors.append(f"'{field}' must be numeric, got {type(worm[field]).__name__}")
 
+def _validate_worm_section(worm: Dict[str, Any]) -> List[str]:
+    """Validate worm section structure."""
+    errors: List[str] = []
+    _check_required_numeric(worm, _WORM_REQUIRED_NUMERIC, errors)
+    _check_hand(worm, errors)
+    _check_optional_numeric(worm, _WORM_OPTIONAL_NUMERIC, errors)
     return errors
 
 
 def _validate_wheel_section(wheel: Dict[str, Any]) -> List[str]:
     """Validate wheel section structure."""
-    errors = []
-
-    # Required numeric fields
-    required_numeric = [
-        'module_mm', 'num_teeth', 'pitch_diameter_mm', 'tip_diameter_mm',
-        'root_diameter_mm', 'throat_diameter_mm', 'helix_angle_deg',
-        'addendum_mm', 'dedendum_mm'
-    ]
-    for field in required_numeric:
-        if field not in wheel:
-            errors.append(f"missing required field '{field}'")
-        elif not isinstance(wheel[field], (int, float)):
-            errors.append(f"'{field}' must be numeric, got {type(wheel[field]).__name__}")
-
-    # Optional numeric fields
-    optional_numeric = ['profile_shift', 'width_mm']
-    for field in optional_numeric:
-        if field in wheel and wheel[field] is not None:
-            if not isinstance(wheel[field], (int, float)):
-                errors.append(f"'{field}' must be numeric, got {type(wheel[field]).__name__}")
-
+    errors: List[str] = []
+    _check_required_numeric(wheel, _WHEEL_REQUIRED_NUMERIC, errors)
+    _check_optional_numeric(wheel, _WHEEL_OPTIONAL_NUMERIC, errors)
     return errors
 
 
 def _validate_assembly_section(assembly: Dict[str, Any]) -> List[str]:
     """Validate assembly section structure."""
-    errors = []
-
-    # Required numeric fields
-    required_numeric = [
-        'centre_distance_mm', 'pressure_angle_deg', 'backlash_mm', 'ratio'
-    ]
-    for field in required_numeric:
-        if field not in assembly:
-            errors.append(f"missing required field '{field}'")
-        elif not isinstance(assembly[field], (int, float)):
-            errors.append(f"'{field}' must be numeric, got {type(assembly[field]).__name__}")
-
-    # Required string fields
-    if 'hand' not in assembly:
-        errors.append("missing required field 'hand'")
-    elif assembly['hand'] not in ['right', 'left']:
-        errors.append(f"'hand' must be 'right' or 'left', got '{assembly['hand']}'")
+    errors: List[str] = []
+    _check_required_numeric(assembly, _ASSEMBLY_REQUIRED_NUMERIC, errors)
+    _check_hand(assembly, errors)
 
     # Optional string field
     if 'profile' in assembly:
-        if assembly['profile'] not in ['ZA', 'ZK', 'ZI']:
+        if not _is_choice(assembly['profile'], _VALID_PROFILES):
             errors.append(f"'profile' must be 'ZA', 'ZK', or 'ZI', got '{assembly['profile']}'")
 
-    # Optional numeric fields
-    optional_numeric = ['efficiency', 'self_locking']
-    for field in optional_numeric:
+    # Optional numeric/bool fields
+    for field in _ASSEMBLY_OPTIONAL_SCALAR:
         if field in assembly and assembly[field] is not None:
             if not isinstance(assembly[field], (int, float, bool)):
                 errors.append(f"'{field}' has invalid type {type(assembly[field]).__name__}")
@@ -169,22 +190,18 @@ def _validate_manufacturing_section(manufacturing: Dict[str, Any]) -> List[str]:
 
     # All fields are optional, but if present must have correct types
     if 'worm_type' in manufacturing:
-        if manufacturing['worm_type'] not in ['cylindrical', 'globoid']:
+        if not _is_choice(manufacturing['worm_type'], _VALID_WORM_TYPES):
             errors.append(f"'worm_type' must be 'cylindrical' or 'globoid', got '{manufacturing['worm_type']}'")
 
     if 'profile' in manufacturing:
-        if manufacturing['profile'] not in ['ZA', 'ZK', 'ZI']:
+        if not _is_choice(manufacturing['profile'], _VALID_PROFILES):
             errors.append(f"'profile' must be 'ZA', 'ZK', or 'ZI', got '{manufacturing['profile']}'")
 
     if 'wheel_throated' in manufacturing:
         if not isinstance(manufacturing['wheel_throated'], bool):
             errors.append(f"'wheel_throated' must be boolean, got {type(manufacturing['wheel_throated']).__name__}")
 
-    optional_numeric = ['worm_length', 'wheel_width', 'hobbing_steps']
-    for field in optional_numeric:
-        if field in manufacturing and manufacturing[field] is not None:
-            if not isinstance(manufacturing[field], (int, float)):
-                errors.append(f"'{field}' must be numeric, got {type(manufacturing[field]).__name__}")
+    _check_optional_numeric(manufacturing, _MANUFACTURING_OPTIONAL_NUMERIC, errors)
 
     if 'virtual_hobbing' in manufacturing:
         if not isinstance(manufacturing['virtual_hobbing'], bool):
@@ -234,9 +251,8 @@ def _validate_part_features(part_features: Dict[str, Any], part_name: str) -> Li
 
     # Check anti_rotation if present
     if 'anti_rotation' in part_features:
-        valid_anti_rotation = ['none', 'DIN6885', 'DD-cut']
-        if part_features['anti_rotation'] not in valid_anti_rotation:
-            errors.append(f"{part_name}.anti_rotation must be one of {valid_anti_rotation}")
+        if not _is_choice(part_features['anti_rotation'], _VALID_ANTI_ROTATION):
+            errors.append(f"{part_name}.anti_rotation must be one of ['none', 'DIN6885', 'DD-cut']")
 
     return errors
 
@@ -467,6 +467,26 @@ def _validate_efficiency(design: DesignInput) -> List[ValidationMessage]:
     return messages
 
 
+def worm_wheel_clearance(
+    centre_distance_mm: float,
+    worm_tip_diameter_mm: float,
+    wheel_root_diameter_mm: float,
+    throat_reduction_mm: float = 0.0,
+) -> float:
+    """
+    Radial clearance between worm tip and wheel root at the centre distance.
+
+    Pure arithmetic with no object construction, so design sweeps can call
+    it directly (or pass NumPy arrays) instead of going through
+    validate_design(). Negative values mean the parts interfere.
+
+    For globoid worms pass throat_reduction_mm: the full tip diameter is at
+    the worm ends, not the engagement zone.
+    """
+    effective_worm_tip_radius = worm_tip_diameter_mm / 2 - throat_reduction_mm
+    return centre_distance_mm - effective_worm_tip_radius - wheel_root_diameter_mm / 2
+
+
 def _validate_clearance(design: DesignInput) -> List[ValidationMessage]:
     """Basic geometric clearance check"""
     messages = []
@@ -479,16 +499,13 @@ def _validate_clearance(design: DesignInput) -> List[ValidationMessage]:
     if worm_tip_dia <= 0 or wheel_root_dia <= 0 or centre_distance <= 0:
         return messages  # Skip if missing values
 
-    worm_tip_radius = worm_tip_dia / 2
-    wheel_root_radius = wheel_root_dia / 2
-
     # For globoid worms, use the throat radius (smaller) for clearance check
-    # The full tip_diameter is at the worm ends, not the engagement zone
     throat_reduction = _get(design, 'worm', 'throat_reduction_mm', default=0) or 0
-    effective_worm_tip_radius = worm_tip_radius - throat_reduction
 
     # At centre distance, worm tip should not reach wheel root
-    clearance = centre_distance - effective_worm_tip_radius - wheel_root_radius
+    clearance = worm_wheel_clearance(
+        centre_distance, worm_tip_dia, wheel_root_dia, throat_reduction
+    )
 
     if clearance < -0.1:
         # Clearly impossible geometry - significant overlap
@@ -113,44 +113,10 @@ def get_version_string() -> str:
 
     return base_version
 
-from ..io.loaders import (
-    load_design_json,
-    save_design_json,
-    WormGearDesign,
-    ManufacturingParams,
-    ManufacturingFeatures
-)
-from ..io.package import generate_package, save_package_to_dir, create_package_zip
+# Only light imports at module level: geometry (build123d/OCP), packaging and
+# Pydantic IO are imported where used, so ``--help`` and argument errors
+# return without paying for the CAD kernel.
 from ..enums import WormType, WormProfile, BoreType
-from ..facade import WormGear, WormWheel, make_pair
-# Virtual hobbing still routes through the private builder; it moves to
-# wormgear.advanced.virtual_hobbing in #203.
-from ..core.virtual_hobbing import _VirtualHobbingWheelGeometry
-from ..core.features import (
-    BoreFeature,
-    KeywayFeature,
-    DDCutFeature,
-    SetScrewFeature,
-    HubFeature,
-    ReliefGrooveFeature,
-    calculate_default_bore,
-    calculate_default_ddcut,
-    get_din_6885_keyway,
-    get_set_screw_size
-)
-from ..core.mesh_alignment import (
-    find_optimal_mesh_rotation,
-    position_for_mesh,
-    mesh_alignment_to_dict,
-    MeshAlignmentResult,
-)
-from ..core.rim_thickness import (
-    measure_rim_thickness,
-    rim_thickness_to_dict,
-    WHEEL_RIM_WARNING_THRESHOLD_MM,
-    WORM_RIM_WARNING_THRESHOLD_MM,
-)
-from ..io.loaders import MeshAlignment, WormPosition, MeasuredGeometry, MeasurementPoint
 
 
 def _format_profile_desc(profile, *, long: bool = False) -> str:
@@ -175,6 +141,8 @@ def _view_in_ocp(wheel, worm, mesh_alignment_result, centre_distance_mm):
         print("Install with: pip install ocp_vscode", file=sys.stderr)
         return
 
+    from ..core.mesh_alignment import position_for_mesh
+
     if wheel is not None and worm is not None:
         if mesh_alignment_result is not None:
             wheel_pos, worm_pos = position_for_mesh(
@@ -202,6 +170,9 @@ def _save_analysis_json(output_dir, design, mesh_alignment_result,
     from datetime import datetime
     import json as _json
 
+    from ..core.mesh_alignment import mesh_alignment_to_dict
+    from ..core.rim_thickness import rim_thickness_to_dict
+
     has_analysis = (mesh_alignment_result is not None
                     or worm_rim_result is not None
                     or wheel_rim_result is not None
@@ -261,6 +232,10 @@ def _build_manufacturing_features(bore_diameter, keyway, set_screw, *, hub=None,
     """Build a ManufacturingFeatures from the parsed CLI features (worm or wheel)."""
     if not (bore_diameter or set_screw or hub):
         return None
+
+    from ..core.features import get_din_6885_keyway
+    from ..io.loaders import ManufacturingFeatures
+
     keyway_dims = get_din_6885_keyway(bore_diameter) if bore_diameter else None
     # DIN 6885 keyway dims tuple: (width, _, shaft_depth, hub_depth) — index 2 for
     # the shaft (worm) depth, index 3 for the hub (wheel) depth.
@@ -291,6 +266,14 @@ def _save_extended_design_json(args, design, use_globoid, use_worm_length, use_w
     """Save the extended JSON containing all manufacturing parameters and measurements."""
     from datetime import datetime
 
+    from ..io.loaders import (
+        ManufacturingParams,
+        MeasuredGeometry,
+        MeasurementPoint,
+        WormGearDesign,
+        save_design_json,
+    )
+
     worm_features = _build_manufacturing_features(
         worm_bore_diameter, worm_keyway, worm_set_screw, side="worm",
     )
@@ -351,6 +334,8 @@ def _parse_set_screw(args, json_features):
     if not (args.set_screw or json_set_screw):
         return None
 
+    from ..core.features import SetScrewFeature
+
     if args.set_screw_size:
         try:
             size_str = args.set_screw_size.upper()
@@ -400,6 +385,14 @@ def _determine_bore(args, pitch_diameter, root_diameter, json_features, bore_cli
     if args.no_bore:
         return bore, keyway, ddcut, set_screw, bore_diameter, thin_rim_warning
 
+    from ..core.bore_sizing import calculate_default_bore
+    from ..core.features import (
+        BoreFeature,
+        DDCutFeature,
+        KeywayFeature,
+        calculate_default_ddcut,
+    )
+
     if bore_cli_arg is not None:
         # CLI override takes priority
         bore_diameter = bore_cli_arg
@@ -525,6 +518,25 @@ def _run_geometry_validation(worm, wheel, *, worm_length, use_globoid, wheel_thr
     return ok
 
 
+class _VersionAction(argparse.Action):
+    """``--version`` that only runs get_version_string() when requested.
+
+    get_version_string() shells out to git (and gh on feature branches), so
+    formatting it into a stock ``action='version'`` at parser-build time
+    would cost every invocation those subprocesses, not just ``--version``.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS,
+                 default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings=option_strings, dest=dest,
+                         default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(f"{parser.prog} {get_version_string()}")
+        parser.exit()
+
+
 def _build_arg_parser() -> argparse.ArgumentParser:
     """Construct the wormgear CLI argument parser."""
     parser = argparse.ArgumentParser(
@@ -580,8 +592,7 @@ More info: https://wormgear.studio
 
     parser.add_argument(
         '-V', '--version',
-        action='version',
-        version=f'%(prog)s {get_version_string()}'
+        action=_VersionAction,
     )
 
     parser.add_argument(
@@ -625,13 +636,17 @@ More info: https://wormgear.studio
         help='Worm sections per turn for smoothness (default: 36)'
     )
 
-    parser.add_argument(
+    # Together these would generate nothing; argparse rejects the pair
+    # before the design is loaded or any geometry is imported.
+    part_group = parser.add_mutually_exclusive_group()
+
+    part_group.add_argument(
         '--worm-only',
         action='store_true',
         help='Generate only the worm'
     )
 
-    parser.add_argument(
+    part_group.add_argument(
         '--wheel-only',
         action='store_true',
         help='Generate only the wheel'
@@ -904,6 +919,21 @@ def main():
     parser = _build_arg_parser()
     args = parser.parse_args()
 
+    # Heavy imports only once the arguments are known to be valid
+    from ..io.loaders import load_design_json
+    from ..io.package import generate_package, save_package_to_dir, create_package_zip
+    from ..facade import WormGear, WormWheel
+    # Virtual hobbing still routes through the private builder; it moves to
+    # wormgear.advanced.virtual_hobbing in #203.
+    from ..core.virtual_hobbing import _VirtualHobbingWheelGeometry
+    from ..core.features import HubFeature, ReliefGrooveFeature, get_din_6885_keyway
+    from ..core.mesh_alignment import find_optimal_mesh_rotation, MeshAlignmentResult
+    from ..core.rim_thickness import (
+        measure_rim_thickness,
+        WHEEL_RIM_WARNING_THRESHOLD_MM,
+        WORM_RIM_WARNING_THRESHOLD_MM,
+    )
+
     # Load design
     try:
         print(f"Loading design from {args.design_file}...")
@@ -943,6 +973,7 @@ def main():
         use_profile = json_mfg.profile
     else:
         use_profile = 'ZA'
+    profile_desc = _format_profile_desc(use_profile)
     use_virtual_hobbing = args.virtual_hobbing or (json_mfg.virtual_hobbing if json_mfg else False)
     use_hobbing_steps = args.hobbing_steps if args.hobbing_steps != 72 else (json_mfg.hobbing_steps if json_mfg else 72)
     use_sections = args.sections if args.sections != 36 else (json_mfg.sections_per_turn if json_mfg else 36)
@@ -1007,10 +1038,8 @@ def main():
             features_desc += f" + relief groove ({worm_relief_groove.type})"
 
         worm_type_desc = "globoid (hourglass)" if use_globoid else "cylindrical"
-        profile_desc = _format_profile_desc(use_profile)
         print(f"\nGenerating worm ({worm_type_desc}, {design.worm.num_starts}-start, module {design.worm.module_mm}mm, {profile_desc}{features_desc})...")
 
-        profile = use_profile
         progress = CLIProgressReporter("Globoid worm") if use_globoid else None
         if use_globoid:
             # Globoid path via the BD-style facade — internally builds the
@@ -1035,7 +1064,7 @@ def main():
                 ddcut=worm_ddcut,
                 set_screw=worm_set_screw,
                 relief_groove=worm_relief_groove,
-                profile=profile,
+                profile=use_profile,
                 generation_method=use_generation_method,
             )
 
@@ -1080,9 +1109,6 @@ def main():
             hub_desc += ")"
             features_desc += f", {hub_desc}"
 
-        profile = use_profile
-        profile_desc = _format_profile_desc(profile)
-
         if use_virtual_hobbing:
             # EXPERIMENTAL: Virtual hobbing simulation
             # Stays on legacy until #203 lands wormgear.advanced.virtual_hobbing
@@ -1104,7 +1130,7 @@ def main():
                 ddcut=wheel_ddcut,
                 set_screw=wheel_set_screw,
                 hub=wheel_hub,
-                profile=profile,
+                profile=use_profile,
                 hob_geometry=hob_geo,
                 progress_callback=hobbing_progress,
                 trim_to_min_engagement=use_trim_engagement
@@ -1122,7 +1148,7 @@ def main():
                 ddcut=wheel_ddcut,
                 set_screw=wheel_set_screw,
                 hub=wheel_hub,
-                profile=profile,
+                profile=use_profile,
                 trim_to_min_engagement=use_trim_engagement,
             )
         print(f"  Volume: {wheel.volume:.2f} mm³")
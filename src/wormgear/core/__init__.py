@@ -21,6 +21,9 @@ Example::
     >>> worm = WormGear(module=2.0, length=40.0, bore=BoreFeature(diameter=8.0))
 """
 
+import importlib
+import importlib.util
+
 # bore_sizing has no build123d dependency — always available.
 from .bore_sizing import calculate_default_bore
 
@@ -33,107 +36,86 @@ _REMOVED_IN_010 = {
     "VirtualHobbingWheelGeometry": "wormgear.advanced.virtual_hobbing",
 }
 
-# Everything else requires build123d. If it's not installed (Pyodide path),
-# only bore_sizing + the removed-name __getattr__ are available.
-try:
+# Everything else requires build123d, so it is resolved lazily (PEP 562):
+# ``import wormgear.core`` (and every ``wormgear.core.<submodule>`` import,
+# which runs this file first) stays cheap, and the OCP/build123d import cost
+# is only paid when a geometry name is first accessed.
+_LAZY_MAP = {
     # Features — public, used as facade kwargs.
-    from .features import (
-        BoreFeature,
-        DDCutFeature,
-        HubFeature,
-        KeywayFeature,
-        ReliefGrooveFeature,
-        SetScrewFeature,
-        calculate_default_ddcut,
-        get_din_6885_keyway,
-    )
-
+    "BoreFeature": "features",
+    "KeywayFeature": "features",
+    "DDCutFeature": "features",
+    "SetScrewFeature": "features",
+    "HubFeature": "features",
+    "ReliefGrooveFeature": "features",
+    "calculate_default_ddcut": "features",
+    "get_din_6885_keyway": "features",
     # Mesh alignment — public utility.
-    from .mesh_alignment import (
-        MeshAlignmentResult,
-        calculate_mesh_rotation,
-        calculate_tolerance_mm3,
-        check_interference,
-        create_axis_markers,
-        find_optimal_mesh_rotation,
-        mesh_alignment_to_dict,
-        position_for_mesh,
-    )
-
+    "MeshAlignmentResult": "mesh_alignment",
+    "find_optimal_mesh_rotation": "mesh_alignment",
+    "calculate_mesh_rotation": "mesh_alignment",
+    "calculate_tolerance_mm3": "mesh_alignment",
+    "check_interference": "mesh_alignment",
+    "position_for_mesh": "mesh_alignment",
+    "create_axis_markers": "mesh_alignment",
+    "mesh_alignment_to_dict": "mesh_alignment",
     # Geometry validation — check a built part realises its calculated spec.
-    from .validate_geometry import (
-        DimensionCheck,
-        GeometryReport,
-        check_pair_geometry,
-        check_wheel_geometry,
-        check_worm_geometry,
-    )
-
+    "check_worm_geometry": "validate_geometry",
+    "check_wheel_geometry": "validate_geometry",
+    "check_pair_geometry": "validate_geometry",
+    "GeometryReport": "validate_geometry",
+    "DimensionCheck": "validate_geometry",
     # Rim thickness — public utility.
-    from .rim_thickness import (
-        WHEEL_RIM_WARNING_THRESHOLD_MM,
-        WORM_RIM_WARNING_THRESHOLD_MM,
-        RimThicknessResult,
-        measure_rim_thickness,
-        rim_thickness_to_dict,
-    )
-
+    "RimThicknessResult": "rim_thickness",
+    "measure_rim_thickness": "rim_thickness",
+    "rim_thickness_to_dict": "rim_thickness",
+    "WHEEL_RIM_WARNING_THRESHOLD_MM": "rim_thickness",
+    "WORM_RIM_WARNING_THRESHOLD_MM": "rim_thickness",
     # Hobbing presets — used by virtual hobbing. Re-exported from
     # ``wormgear.advanced.virtual_hobbing`` post-#203; kept here for
     # backwards compatibility with the (now-private) hobbing wheel.
-    from .virtual_hobbing import (
-        HOBBING_PRESETS,
-        get_hobbing_preset,
-        get_preset_steps,
-    )
-
-    __all__ = [
-        # Features
-        "BoreFeature",
-        "KeywayFeature",
-        "DDCutFeature",
-        "SetScrewFeature",
-        "HubFeature",
-        "ReliefGrooveFeature",
-        "calculate_default_bore",
-        "calculate_default_ddcut",
-        "get_din_6885_keyway",
-        # Mesh alignment
-        "MeshAlignmentResult",
-        "find_optimal_mesh_rotation",
-        "calculate_mesh_rotation",
-        "calculate_tolerance_mm3",
-        "check_interference",
-        "position_for_mesh",
-        "create_axis_markers",
-        "mesh_alignment_to_dict",
-        # Geometry validation
-        "check_worm_geometry",
-        "check_wheel_geometry",
-        "check_pair_geometry",
-        "GeometryReport",
-        "DimensionCheck",
-        # Rim thickness
-        "RimThicknessResult",
-        "measure_rim_thickness",
-        "rim_thickness_to_dict",
-        "WHEEL_RIM_WARNING_THRESHOLD_MM",
-        "WORM_RIM_WARNING_THRESHOLD_MM",
-        # Hobbing presets
-        "HOBBING_PRESETS",
-        "get_hobbing_preset",
-        "get_preset_steps",
-    ]
-except ImportError:
+    "HOBBING_PRESETS": "virtual_hobbing",
+    "get_hobbing_preset": "virtual_hobbing",
+    "get_preset_steps": "virtual_hobbing",
+}
+
+
+def _build123d_available() -> bool:
+    """Check for build123d without importing it."""
+    try:
+        return importlib.util.find_spec("build123d") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+if _build123d_available():
+    __all__ = ["calculate_default_bore", *_LAZY_MAP]
+else:
     # Pyodide path — no build123d.
     __all__ = ["calculate_default_bore"]
 
 
 def __getattr__(name):
-    """Helpful error for removed names (#200, removed in 0.1.0)."""
+    """Lazy-load geometry names; helpful error for removed names (#200)."""
+    if name in _LAZY_MAP:
+        try:
+            module = importlib.import_module(f".{_LAZY_MAP[name]}", __name__)
+        except ImportError as exc:
+            # Keep hasattr()/getattr(..., default) feature detection working
+            # when build123d is missing (e.g. Pyodide)
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} (requires build123d)"
+            ) from exc
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
     if name in _REMOVED_IN_010:
         raise ImportError(
             f"{name} was removed in wormgear 0.1.0. "
             f"Use {_REMOVED_IN_010[name]} instead. See #200 for migration."
         )
     raise AttributeError(f"module 'wormgear.core' has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MAP))
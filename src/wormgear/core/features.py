@@ -9,6 +9,7 @@ Supports:
 """
 
 import math
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Optional, Tuple
 from build123d import (
@@ -39,6 +40,12 @@ DIN_6885_KEYWAYS = {
     (85, 95): (25, 14, 9.0, 5.4),
 }
 
+# Bisect view of DIN_6885_KEYWAYS. The ranges are contiguous, so sorted upper
+# bounds alone locate the row for any bore in [_DIN_6885_MIN, _DIN_6885_UPPERS[-1]).
+_DIN_6885_MIN = min(lo for lo, _ in DIN_6885_KEYWAYS)
+_DIN_6885_UPPERS = tuple(hi for _, hi in sorted(DIN_6885_KEYWAYS))
+_DIN_6885_DIMS = tuple(DIN_6885_KEYWAYS[r] for r in sorted(DIN_6885_KEYWAYS))
+
 
 # Set screw sizing based on bore diameter
 # Format: bore_range: (screw_size_name, thread_diameter_mm)
@@ -65,10 +72,10 @@ def get_din_6885_keyway(bore_diameter: float) -> Optional[Tuple[float, float, fl
         Tuple of (key_width, key_height, shaft_depth, hub_depth) in mm,
         or None if bore is outside standard range
     """
-    for (min_d, max_d), dims in DIN_6885_KEYWAYS.items():
-        if min_d <= bore_diameter < max_d:
-            return dims
-    return None
+    # Written as a chained comparison so NaN falls through to None too
+    if not (_DIN_6885_MIN <= bore_diameter < _DIN_6885_UPPERS[-1]):
+        return None
+    return _DIN_6885_DIMS[bisect_right(_DIN_6885_UPPERS, bore_diameter)]
 
 
 def get_set_screw_size(bore_diameter: float) -> Tuple[str, float]:
@@ -482,6 +489,11 @@ def create_bore(
     Returns:
         Part with bore cut
     """
+    return part - _bore_cutter(bore, part_length, axis)
+
+
+def _bore_cutter(bore: BoreFeature, part_length: float, axis: Axis) -> Part:
+    """Build the bore cylinder to subtract, aligned to ``axis``."""
     bore_radius = bore.diameter / 2
 
     if bore.through:
@@ -504,10 +516,7 @@ def create_bore(
         bore_cyl = bore_cyl.rotate(Axis.X, 90)
     # Z axis is default, no rotation needed
 
-    # Subtract from part
-    result = part - bore_cyl
-
-    return result
+    return bore_cyl
 
 
 def create_keyway(
@@ -537,6 +546,16 @@ def create_keyway(
     Returns:
         Part with keyway cut
     """
+    return part - _keyway_cutter(bore, keyway, part_length, axis)
+
+
+def _keyway_cutter(
+    bore: BoreFeature,
+    keyway: KeywayFeature,
+    part_length: float,
+    axis: Axis
+) -> Part:
+    """Build the keyway slot box to subtract, aligned to ``axis``."""
     bore_radius = bore.diameter / 2
     width, depth = keyway.get_dimensions(bore.diameter)
 
@@ -546,37 +565,22 @@ def create_keyway(
     else:
         kw_length = part_length
 
-    if keyway.is_shaft:
-        # Shaft keyway (worm): cut from center axis outward
-        # The keyway slot sits at the bore surface and extends outward by 'depth'
-        # But since we have a bore hole, we need to create a slot that goes
-        # from the center through the bore and into the shaft material by 'depth'
-        #
-        # DIN 6885 t1 is measured from the shaft surface, so the bottom of the
-        # keyway is at radius = bore_radius + depth
-        keyway_box = Box(
-            bore_radius + depth,  # from center to (bore_radius + depth)
-            width,  # tangential width
-            kw_length + 1.0,  # axial length (slightly longer for clean cut)
-            align=(Align.MIN, Align.CENTER, Align.CENTER)
-        )
-        # Position starting from center (X=0), extending in +X direction
-        # No translation needed - MIN alignment puts it at origin
-    else:
-        # Hub keyway (wheel): cut into the hub material around the bore
-        # The slot extends from inside the bore outward through the hub material
-        # DIN 6885 t2 is measured from the bore surface outward
-        #
-        # To avoid a facet covering the bore, extend the box inward past the
-        # bore surface so it fully intersects with the cylindrical bore
-        keyway_box = Box(
-            bore_radius + depth,  # from center to (bore_radius + depth)
-            width,  # tangential width
-            kw_length + 1.0,  # axial length (slightly longer for clean cut)
-            align=(Align.MIN, Align.CENTER, Align.CENTER)
-        )
-        # Position starting from center (X=0), extending in +X direction
-        # No translation needed - MIN alignment puts it at origin
+    # Shaft keyway (worm): DIN 6885 t1 is measured from the shaft surface, so
+    # the slot bottom sits at radius = bore_radius + depth.
+    # Hub keyway (wheel): DIN 6885 t2 is measured from the bore surface
+    # outward, so the slot bottom is likewise at bore_radius + depth.
+    #
+    # Either way the slot runs from the centre axis outward, so it fully
+    # intersects the cylindrical bore and leaves no facet covering it; the
+    # is_shaft flag only selects which DIN depth get_dimensions() returns.
+    keyway_box = Box(
+        bore_radius + depth,  # from center to (bore_radius + depth)
+        width,  # tangential width
+        kw_length + 1.0,  # axial length (slightly longer for clean cut)
+        align=(Align.MIN, Align.CENTER, Align.CENTER)
+    )
+    # Position starting from center (X=0), extending in +X direction
+    # No translation needed - MIN alignment puts it at origin
 
     # Rotate to correct axis if needed
     if axis == Axis.X:
@@ -584,10 +588,7 @@ def create_keyway(
     elif axis == Axis.Y:
         keyway_box = keyway_box.rotate(Axis.X, 90)
 
-    # Subtract from part
-    result = part - keyway_box
-
-    return result
+    return keyway_box
 
 
 def create_set_screw(
@@ -1142,10 +1143,13 @@ def add_bore_and_keyway(
     result = part
 
     if bore is not None:
-        result = create_bore(result, bore, part_length, axis)
-
-    if keyway is not None:
-        result = create_keyway(result, bore, keyway, part_length, axis)
+        cutter = _bore_cutter(bore, part_length, axis)
+        if keyway is not None:
+            # Fuse the two primitive cutters first so the many-faced gear
+            # body goes through one boolean subtraction instead of two.
+            # The keyway box starts at the axis, so the union is connected.
+            cutter = cutter + _keyway_cutter(bore, keyway, part_length, axis)
+        result = result - cutter
 
     if ddcut is not None:
         result = create_ddcut(result, bore, ddcut, part_length, axis)
@@ -221,21 +221,28 @@ class _GloboidWormGeometry(BaseGeometry):
             self._report_progress("  Unioning threads...", 70.0)
             from OCP.BRepAlgoAPI import BRepAlgoAPI_Fuse
 
-            combined_threads = threads[0]
-            for i, thread in enumerate(threads[1:], 1):
+            def fuse_pair(a, b):
                 try:
                     fuse_op = BRepAlgoAPI_Fuse(
-                        combined_threads.wrapped if hasattr(combined_threads, 'wrapped') else combined_threads,
-                        thread.wrapped if hasattr(thread, 'wrapped') else thread
+                        a.wrapped if hasattr(a, 'wrapped') else a,
+                        b.wrapped if hasattr(b, 'wrapped') else b
                     )
                     fuse_op.Build()
                     if fuse_op.IsDone():
-                        combined_threads = Part(fuse_op.Shape())
-                    else:
-                        combined_threads = combined_threads + thread
+                        return Part(fuse_op.Shape())
                 except Exception as e:
-                    logger.debug(f"OCP fuse failed for thread {i}: {e}, using fallback")
-                    combined_threads = combined_threads + thread
+                    logger.debug(f"OCP thread fuse failed: {e}, using fallback")
+                return a + b
+
+            # Balanced pairwise reduction rather than a left fold, so no
+            # fuse re-processes an ever-growing accumulated operand
+            pending = threads
+            while len(pending) > 1:
+                paired = [fuse_pair(a, b) for a, b in zip(pending[::2], pending[1::2])]
+                if len(pending) % 2:
+                    paired.append(pending[-1])
+                pending = paired
+            combined_threads = pending[0]
 
             # Union core with all threads
             self._report_progress("  Unioning core with threads...", 80.0)
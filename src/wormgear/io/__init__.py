@@ -57,6 +57,8 @@ from .schema import (
     SCHEMA_VERSION,
     get_schema_v1,
     validate_json_schema,
+    is_valid_json_schema,
+    iter_validate_designs,
     create_example_schema_v1,
 )
 
@@ -96,5 +98,7 @@ __all__ = [
     "SCHEMA_VERSION",
     "get_schema_v1",
     "validate_json_schema",
+    "is_valid_json_schema",
+    "iter_validate_designs",
     "create_example_schema_v1",
 ]
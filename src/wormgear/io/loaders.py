@@ -10,12 +10,22 @@ Uses Pydantic V2 for automatic validation and enum coercion.
 import json
 from math import pi
 from pathlib import Path
+from types import ModuleType
 from typing import Optional, Union, Dict, Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from ..enums import Hand, WormType, WormProfile, BoreType, AntiRotation
 
+# Optional Rust-backed JSON parser (pip install wormgear[fast]); stdlib json
+# is the fallback
+_orjson: Optional[ModuleType]
+try:
+    import orjson
+    _orjson = orjson
+except ImportError:
+    _orjson = None
+
 
 class SetScrewSpec(BaseModel):
     """Set screw specification."""
@@ -465,6 +475,20 @@ class ManufacturingFeatures(BaseModel):
     bolt_diameter: Optional[float] = None
 
 
+def _read_json(filepath: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    if _orjson is not None:
+        data = filepath.read_bytes()
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals that json.dump writes;
+            # re-parse with json so such files load the same either way
+            return json.loads(data)
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
 def load_design_json(filepath: Union[str, Path]) -> WormGearDesign:
     """
     Load worm gear design from calculator JSON export.
@@ -486,8 +510,7 @@ def load_design_json(filepath: Union[str, Path]) -> WormGearDesign:
     if not filepath.exists():
         raise FileNotFoundError(f"Design file not found: {filepath}")
 
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    data = _read_json(filepath)
 
     # Check for 'design' wrapper (some exports have this)
     if 'design' in data:
@@ -521,24 +544,15 @@ def save_design_json(design: WormGearDesign, filepath: Union[str, Path]) -> None
     """
     filepath = Path(filepath)
 
-    # Convert to dict, handling enums
-    data = design.model_dump(exclude_none=True)
+    # JSON mode has pydantic-core emit enum values directly, so no Python
+    # pass over the nested dict is needed
+    data = design.model_dump(mode='json', exclude_none=True)
 
     # Add schema version
     data['schema_version'] = '2.0'
 
-    # Convert enums to their values for JSON
-    def convert_enums(obj):
-        if isinstance(obj, dict):
-            return {k: convert_enums(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_enums(v) for v in obj]
-        elif hasattr(obj, 'value'):  # Enum
-            return obj.value
-        return obj
-
-    data = convert_enums(data)
-
-    # Write JSON with nice formatting
+    # Write JSON with nice formatting. Encode in one call rather than via
+    # json.dump's chunked writes; stdlib json keeps the output stable
+    # (ASCII escapes, float repr) for files users diff and commit.
     with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(data, indent=2))
@@ -11,6 +11,7 @@ CLI writes files to a directory (with optional ZIP); web always ZIPs.
 import io
 import json
 import logging
+import os
 import tempfile
 import zipfile
 from dataclasses import dataclass, field
@@ -398,6 +399,21 @@ def _cli_file_names(design: WormGearDesign) -> dict[str, str]:
     }
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data via a sibling ``.tmp`` file and ``os.replace()``.
+
+    An interrupted run leaves the previous file intact rather than a
+    truncated STEP/3MF that looks valid by name.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def save_package_to_dir(
     files: PackageFiles,
     output_dir: Path,
@@ -436,17 +452,17 @@ def save_package_to_dir(
     for name, data in file_map.items():
         if data is not None:
             path = output_dir / name
-            path.write_bytes(data)
+            _write_atomic(path, data)
             written.append(path)
 
     if files.design_json is not None:
         path = output_dir / "design.json"
-        path.write_text(files.design_json, encoding="utf-8")
+        _write_atomic(path, files.design_json.encode("utf-8"))
         written.append(path)
 
     if files.design_md is not None:
         path = output_dir / "design.md"
-        path.write_text(files.design_md, encoding="utf-8")
+        _write_atomic(path, files.design_md.encode("utf-8"))
         written.append(path)
 
     return written
@@ -9,15 +9,46 @@ between dimensional data and manufacturing features.
 
 Note: The primary schemas are now generated from Pydantic models via
 scripts/generate_schemas.py. This module provides runtime validation helpers.
+
+For bulk files holding a top-level JSON array of designs, use
+iter_validate_designs() to validate them one at a time in constant memory
+(requires the optional ijson package: pip install wormgear[stream]).
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Final
+
+SCHEMA_VERSION: Final = "2.1"
+
+# Oldest schema version upgrade_schema() can migrate from
+MIN_SUPPORTED_VERSION: Final = "1.0"
+
+
+@lru_cache(maxsize=32)
+def _version_tuple(version: str) -> tuple[int, ...]:
+    """Parse "MAJOR.MINOR" into a comparable tuple of ints (cached)."""
+    return tuple(int(x) for x in version.split('.'))
 
-SCHEMA_VERSION = "2.1"
 
+_MIN_T = _version_tuple(MIN_SUPPORTED_VERSION)
+_MAX_T = _version_tuple(SCHEMA_VERSION)
 
-def get_schema_v1() -> Dict:
+# Sections every design file must contain
+_REQUIRED_SECTIONS = ("worm", "wheel", "assembly")
+
+# Parts that may carry a features subsection
+_PART_NAMES = ("worm", "wheel")
+
+# Accepted values for features.<part>.anti_rotation
+_VALID_ANTI_ROT = frozenset({"none", "DIN6885", "ddcut"})
+
+
+def get_schema_v1() -> dict:
     """
     Get JSON schema version 1.0 (Option B: Separate features section).
 
@@ -125,7 +156,71 @@ def get_schema_v1() -> Dict:
     }
 
 
-def validate_json_schema(data: Dict) -> Dict[str, Any]:
+def _check_version(data: dict, target: str = SCHEMA_VERSION) -> tuple[str, bool]:
+    """Return (declared schema_version or "unknown", whether it equals target)."""
+    version = data.get("schema_version", "unknown")
+    return version, version == target
+
+
+def _iter_part_features(data: dict) -> Iterator[tuple[str, dict]]:
+    """Yield (part_name, features) for each part present in features."""
+    features = data.get("features")
+    if features:
+        for part_name in _PART_NAMES:
+            part_features = features.get(part_name)
+            if part_features is not None:
+                yield part_name, part_features
+
+
+def _iter_errors(data: dict) -> Iterator[str]:
+    """Lazily yield validation errors, so callers can stop at the first."""
+    # Validate required sections
+    for section in _REQUIRED_SECTIONS:
+        if section not in data:
+            yield f"Missing required section: '{section}'"
+
+    # Validate anti_rotation field if features section exists
+    for part_name, part_features in _iter_part_features(data):
+        anti_rot = part_features.get("anti_rotation")
+        # isinstance first: list/dict values can't be hashed for the lookup
+        if anti_rot is not None and not (
+            isinstance(anti_rot, str) and anti_rot in _VALID_ANTI_ROT
+        ):
+            yield (
+                f"Invalid anti_rotation value '{anti_rot}' for {part_name}. "
+                "Must be one of: none, DIN6885, ddcut"
+            )
+
+
+def _iter_warnings(data: dict, schema_version: str, is_current: bool) -> Iterator[str]:
+    """Lazily yield validation warnings."""
+    # Check schema version
+    if schema_version == "unknown":
+        yield "Missing 'schema_version' field (assuming legacy format)"
+    elif not is_current:
+        yield f"Schema version {schema_version} != current {SCHEMA_VERSION}"
+
+    # Check that ddcut_depth_percent is provided if using ddcut
+    for part_name, part_features in _iter_part_features(data):
+        if (part_features.get("anti_rotation") == "ddcut"
+                and "ddcut_depth_percent" not in part_features):
+            yield (
+                f"{part_name}.anti_rotation='ddcut' but ddcut_depth_percent not specified "
+                "(will use default 15%)"
+            )
+
+
+def is_valid_json_schema(data: dict) -> bool:
+    """
+    Check validity only, stopping at the first error.
+
+    Cheaper than validate_json_schema() when the error and warning text is
+    not needed (e.g. filtering a batch of designs).
+    """
+    return next(_iter_errors(data), None) is None
+
+
+def validate_json_schema(data: dict) -> dict[str, Any]:
     """
     Validate JSON data against schema.
 
@@ -135,8 +230,8 @@ def validate_json_schema(data: Dict) -> Dict[str, Any]:
     Returns:
         {
             "valid": bool,
-            "errors": List[str],
-            "warnings": List[str],
+            "errors": list[str],
+            "warnings": list[str],
             "schema_version": str
         }
 
@@ -146,50 +241,47 @@ def validate_json_schema(data: Dict) -> Dict[str, Any]:
         >>> if not result["valid"]:
         ...     print(f"Errors: {result['errors']}")
     """
-    errors = []
-    warnings = []
-
-    # Check schema version
-    schema_version = data.get("schema_version", "unknown")
-    if schema_version == "unknown":
-        warnings.append("Missing 'schema_version' field (assuming legacy format)")
-    elif schema_version != SCHEMA_VERSION:
-        warnings.append(f"Schema version {schema_version} != current {SCHEMA_VERSION}")
-
-    # Validate required sections
-    for section in ["worm", "wheel", "assembly"]:
-        if section not in data:
-            errors.append(f"Missing required section: '{section}'")
-
-    # Validate anti_rotation field if features section exists
-    if "features" in data:
-        for part_name in ["worm", "wheel"]:
-            if part_name in data["features"]:
-                part_features = data["features"][part_name]
-                anti_rot = part_features.get("anti_rotation")
-                if anti_rot is not None:
-                    valid_values = ["none", "DIN6885", "ddcut"]
-                    if anti_rot not in valid_values:
-                        errors.append(
-                            f"Invalid anti_rotation value '{anti_rot}' for {part_name}. "
-                            f"Must be one of: {', '.join(valid_values)}"
-                        )
-                    # Check that ddcut_depth_percent is provided if using ddcut
-                    if anti_rot == "ddcut" and "ddcut_depth_percent" not in part_features:
-                        warnings.append(
-                            f"{part_name}.anti_rotation='ddcut' but ddcut_depth_percent not specified "
-                            "(will use default 15%)"
-                        )
+    schema_version, is_current = _check_version(data)
+    errors = list(_iter_errors(data))
 
     return {
-        "valid": len(errors) == 0,
+        "valid": not errors,
         "errors": errors,
-        "warnings": warnings,
+        "warnings": list(_iter_warnings(data, schema_version, is_current)),
         "schema_version": schema_version
     }
 
 
-def detect_schema_version(data: Dict) -> str:
+def iter_validate_designs(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Stream-validate a JSON file containing a top-level array of designs.
+
+    Each array element is parsed and passed to validate_json_schema() in
+    turn, so memory use stays constant however many designs the file holds.
+
+    Args:
+        path: Path to a JSON file whose root is an array of design objects
+
+    Yields:
+        validate_json_schema() result for each design, in file order
+
+    Raises:
+        ImportError: If the optional ijson package is not installed
+    """
+    try:
+        import ijson
+    except ImportError as e:
+        raise ImportError(
+            "iter_validate_designs requires ijson. "
+            "Install with: pip install wormgear[stream]"
+        ) from e
+
+    with open(path, "rb") as f:
+        for design in ijson.items(f, "item", use_float=True):
+            yield validate_json_schema(design)
+
+
+def detect_schema_version(data: dict) -> str:
     """
     Detect schema version from JSON data using heuristics.
 
@@ -215,7 +307,7 @@ def detect_schema_version(data: Dict) -> str:
     return "1.0"  # Default to oldest
 
 
-def upgrade_schema(data: Dict, target_version: str = SCHEMA_VERSION) -> Dict:
+def upgrade_schema(data: dict, target_version: str = SCHEMA_VERSION) -> dict:
     """
     Upgrade JSON data from older schema version to target version.
 
@@ -237,21 +329,17 @@ def upgrade_schema(data: Dict, target_version: str = SCHEMA_VERSION) -> Dict:
         >>> new_data = upgrade_schema(old_data, "2.0")
         >>> assert new_data["schema_version"] == "2.0"
     """
-    import copy
-
     # Don't modify original
     data = copy.deepcopy(data)
 
-    current_version = detect_schema_version(data)
-    MIN_SUPPORTED_VERSION = "1.0"
+    # Already current: nothing to migrate or stamp
+    if _check_version(data, target_version)[1]:
+        return data
 
-    # Parse versions for comparison
-    def version_tuple(v: str):
-        return tuple(int(x) for x in v.split('.'))
+    current_version = detect_schema_version(data)
 
-    current = version_tuple(current_version)
-    target = version_tuple(target_version)
-    min_supported = version_tuple(MIN_SUPPORTED_VERSION)
+    current = _version_tuple(current_version)
+    target = _version_tuple(target_version)
 
     if current > target:
         raise ValueError(
@@ -259,25 +347,110 @@ def upgrade_schema(data: Dict, target_version: str = SCHEMA_VERSION) -> Dict:
             f"Use an older version of wormgear to read this file."
         )
 
-    if current < min_supported:
+    if current < _MIN_T:
         raise ValueError(
             f"Schema version {current_version} is too old. "
             f"Minimum supported version is {MIN_SUPPORTED_VERSION}."
         )
 
     # Apply migrations in sequence
-    if current < (2, 0) and target >= (2, 0):
-        data = _migrate_1x_to_2x(data)
+    for to_version, migrate in _SCHEMA_MIGRATIONS:
+        if current < to_version <= target:
+            data = migrate(data)
 
     data['schema_version'] = target_version
     return data
 
 
-def _migrate_1x_to_2x(data: Dict) -> Dict:
+# Sentinel for single-lookup dict.pop()/get() in migrations
+_MISSING = object()
+
+# Schema 1.x -> 2.x migration steps, applied in order by _migrate_1x_to_2x.
+# Paths are dotted keys into the design dict, split once at import below.
+_MIGRATIONS_1_TO_2 = (
+    # Move features from manufacturing to features section
+    ("move", "manufacturing.worm_features", "features.worm"),
+    ("move", "manufacturing.wheel_features", "features.wheel"),
+    # Normalize hand enum (was uppercase in some 1.x versions)
+    ("lower", "worm.hand"),
+    ("lower", "assembly.hand"),
+    # Normalize profile enum (should be uppercase)
+    ("upper", "manufacturing.profile"),
+)
+
+
+def _compile_migrations(table: tuple[tuple[str, ...], ...]) -> tuple[tuple[Any, ...], ...]:
+    """Pre-split each step's dotted paths so migrating never re-parses them."""
+    return tuple(
+        (op, *(tuple(path.split('.')) for path in paths))
+        for op, *paths in table
+    )
+
+
+_MIGRATION_PLAN_1_TO_2 = _compile_migrations(_MIGRATIONS_1_TO_2)
+
+
+def _resolve_parent(
+    data: dict[str, Any], path: tuple[str, ...], create: bool = False
+) -> tuple[dict[str, Any] | None, str]:
+    """
+    Walk a pre-split key path and return (parent_dict, final_key).
+
+    parent_dict is None if an intermediate section is not a dict. With
+    create=True, missing sections are added; a section that exists but is
+    not a dict is never replaced, so validation can report it.
+    """
+    *parents, key = path
+    node = data
+    for part in parents:
+        child = node.get(part, _MISSING)
+        if child is _MISSING and create:
+            child = node[part] = {}
+        elif not isinstance(child, dict):
+            return None, key
+        node = child
+    return node, key
+
+
+def _do_move(data: dict, src: tuple[str, ...], dst: tuple[str, ...]) -> None:
+    """Move src to dst, dropping src if dst already exists (never overwrite)."""
+    src_parent, src_key = _resolve_parent(data, src)
+    if src_parent is None or src_key not in src_parent:
+        return
+    dst_parent, dst_key = _resolve_parent(data, dst, create=True)
+    if dst_parent is None:
+        return  # Destination section is malformed; leave src for validation
+    value = src_parent.pop(src_key)
+    dst_parent.setdefault(dst_key, value)
+
+
+def _do_case(data: dict, path: tuple[str, ...], method: str) -> None:
+    """Apply a str case method (lower/upper) to the value at path, if a string."""
+    parent, key = _resolve_parent(data, path)
+    if parent is None:
+        return
+    value = parent.get(key)
+    if isinstance(value, str):
+        parent[key] = getattr(value, method)()
+
+
+_MIGRATION_OPS: dict[str, Callable[..., None]] = {
+    "move": _do_move,
+    "lower": lambda data, path: _do_case(data, path, "lower"),
+    "upper": lambda data, path: _do_case(data, path, "upper"),
+}
+
+
+def _apply_migration(data: dict, op: str, *args: tuple[str, ...]) -> None:
+    """Dispatch a single migration step from a migration table."""
+    _MIGRATION_OPS[op](data, *args)
+
+
+def _migrate_1x_to_2x(data: dict) -> dict:
     """
     Migrate from schema 1.x to 2.x.
 
-    Changes:
+    Changes (see _MIGRATIONS_1_TO_2):
     - Move worm_features/wheel_features from manufacturing to features section
     - Normalize enum values (hand to lowercase, profile to uppercase)
     - Add missing required fields with defaults
@@ -286,50 +459,27 @@ def _migrate_1x_to_2x(data: Dict) -> Dict:
     # Track upgrade
     data['_upgraded_from'] = data.get('schema_version', '1.0')
 
-    # 1. Move features from manufacturing to features section
-    manufacturing = data.get('manufacturing', {})
-
-    if 'worm_features' in manufacturing or 'wheel_features' in manufacturing:
-        if 'features' not in data:
-            data['features'] = {}
-
-        # Only migrate if target doesn't already exist (preserve existing features)
-        if 'worm_features' in manufacturing:
-            if 'worm' not in data['features']:
-                data['features']['worm'] = manufacturing.pop('worm_features')
-            else:
-                manufacturing.pop('worm_features')  # Just remove, don't overwrite
-
-        if 'wheel_features' in manufacturing:
-            if 'wheel' not in data['features']:
-                data['features']['wheel'] = manufacturing.pop('wheel_features')
-            else:
-                manufacturing.pop('wheel_features')  # Just remove, don't overwrite
-
-    # 2. Normalize hand enum (was uppercase in some 1.x versions)
-    for section in ['worm', 'assembly']:
-        if section in data and 'hand' in data[section]:
-            hand_value = data[section]['hand']
-            if isinstance(hand_value, str):
-                data[section]['hand'] = hand_value.lower()
-
-    # 3. Normalize profile enum (should be uppercase)
-    if 'manufacturing' in data and 'profile' in data['manufacturing']:
-        profile_value = data['manufacturing']['profile']
-        if isinstance(profile_value, str):
-            data['manufacturing']['profile'] = profile_value.upper()
-
-    # 4. Ensure features section exists with defaults
-    if 'features' not in data:
-        data['features'] = {
-            'worm': {'bore_type': 'none'},
-            'wheel': {'bore_type': 'none'}
-        }
+    for step in _MIGRATION_PLAN_1_TO_2:
+        _apply_migration(data, *step)
+
+    # Ensure features section exists with defaults
+    data.setdefault('features', {
+        'worm': {'bore_type': 'none'},
+        'wheel': {'bore_type': 'none'}
+    })
 
     return data
 
 
-def validate_schema_version(data: Dict) -> bool:
+# Ordered (to_version, migration) steps. upgrade_schema() runs every step
+# whose to_version lies in (current, target]; a new schema major adds one
+# entry here rather than another branch in upgrade_schema().
+_SCHEMA_MIGRATIONS: tuple[tuple[tuple[int, ...], Callable[[dict], dict]], ...] = (
+    ((2, 0), _migrate_1x_to_2x),
+)
+
+
+def validate_schema_version(data: dict) -> bool:
     """
     Check if schema version is supported for loading.
 
@@ -339,116 +489,17 @@ def validate_schema_version(data: Dict) -> bool:
     Returns:
         True if version is supported
     """
-    version = detect_schema_version(data)
-
-    def version_tuple(v: str):
-        return tuple(int(x) for x in v.split('.'))
+    current = _version_tuple(detect_schema_version(data))
+    return _MIN_T <= current <= _MAX_T
 
-    MIN_SUPPORTED = "1.0"
-    current = version_tuple(version)
-    min_supported = version_tuple(MIN_SUPPORTED)
-    max_supported = version_tuple(SCHEMA_VERSION)
 
-    return min_supported <= current <= max_supported
-
-
-def create_example_schema_v1() -> Dict:
+def create_example_schema_v1() -> dict:
     """
     Create an example JSON file with all fields documented (Option B format).
 
-    This can be used as a template by the calculator.
+    This can be used as a template by the calculator. The template lives in
+    schema_examples and is only imported when an example is requested.
     """
-    return {
-        "schema_version": "1.0",
-        "_generator": "wormgearcalc v2.0.0",
-        "_created": datetime.now().isoformat(),
-        "_note": "Example globoid worm gear with features - Schema v1.0 Option B",
-
-        "worm": {
-            # Core dimensions (required)
-            "module_mm": 0.4,
-            "num_starts": 1,
-            "pitch_diameter_mm": 6.8,
-            "tip_diameter_mm": 7.6,
-            "root_diameter_mm": 5.8,
-            "lead_mm": 1.257,
-            "lead_angle_deg": 3.35,
-            "addendum_mm": 0.4,
-            "dedendum_mm": 0.5,
-            "thread_thickness_mm": 0.628,
-            "hand": "right",
-            "profile_shift": 0.0,
-
-            # Worm type (optional)
-            "type": "globoid",  # "cylindrical" or "globoid"
-
-            # Globoid-specific (only if type="globoid")
-            "throat_reduction_mm": 0.05,
-            "throat_curvature_radius_mm": 3.0,
-
-            # Geometry override (optional)
-            "length_mm": 6.0  # If omitted, CLI uses default
-        },
+    from .schema_examples import create_example_schema_v1 as _create
 
-        "wheel": {
-            # Core dimensions (required)
-            "module_mm": 0.4,
-            "num_teeth": 15,
-            "pitch_diameter_mm": 6.0,
-            "tip_diameter_mm": 6.8,
-            "root_diameter_mm": 5.1,
-            "throat_diameter_mm": 6.4,
-            "helix_angle_deg": 86.65,
-            "addendum_mm": 0.4,
-            "dedendum_mm": 0.45,
-            "profile_shift": 0.0,
-
-            # Geometry override (optional)
-            "width_mm": 1.5  # If omitted, auto-calculated
-        },
-
-        "assembly": {
-            "centre_distance_mm": 6.35,
-            "pressure_angle_deg": 20.0,
-            "backlash_mm": 0.02,
-            "hand": "right",
-            "ratio": 15,
-            "efficiency_percent": None,
-            "self_locking": False
-        },
-
-        # Optional: Manufacturing features (separate section - Option B)
-        "features": {
-            "worm": {
-                "bore_diameter_mm": 2.0,
-                "anti_rotation": "ddcut",  # "none" | "DIN6885" | "ddcut"
-                "ddcut_depth_percent": 15.0,  # Only if anti_rotation="ddcut"
-                "set_screw": {
-                    "size": "M2",
-                    "count": 1
-                }
-            },
-            "wheel": {
-                "bore_diameter_mm": 2.0,
-                "anti_rotation": "DIN6885",  # Standard keyway
-                "set_screw": None,
-                "hub": {
-                    "type": "flush",  # "flush", "extended", "flanged"
-                    "length_mm": None,
-                    "flange_diameter_mm": None,
-                    "flange_thickness_mm": None,
-                    "bolt_holes": None,
-                    "bolt_diameter_mm": None
-                }
-            }
-        },
-
-        # Optional: Manufacturing parameters
-        "manufacturing": {
-            "profile": "ZA",  # "ZA" (straight), "ZK" (circular arc), "ZI" (involute)
-            "virtual_hobbing": False,  # Use virtual hobbing simulation
-            "hobbing_steps": 18,  # Number of hobbing steps
-            "throated_wheel": False,  # Throated/hobbed wheel style
-            "sections_per_turn": 36  # Smoothness parameter
-        }
-    }
+    return _create()
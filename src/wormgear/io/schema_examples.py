@@ -0,0 +1,116 @@
+"""
+Example design document for the schema v1.0 contract.
+
+Kept out of schema.py so importing the validation helpers does not build
+this template; schema.create_example_schema_v1() imports it on demand.
+"""
+
+import copy
+from datetime import datetime
+
+# Static body of create_example_schema_v1(); only _created varies per call.
+_EXAMPLE_TEMPLATE_V1: dict = {
+    "schema_version": "1.0",
+    "_generator": "wormgearcalc v2.0.0",
+    "_created": None,  # Filled in per call
+    "_note": "Example globoid worm gear with features - Schema v1.0 Option B",
+
+    "worm": {
+        # Core dimensions (required)
+        "module_mm": 0.4,
+        "num_starts": 1,
+        "pitch_diameter_mm": 6.8,
+        "tip_diameter_mm": 7.6,
+        "root_diameter_mm": 5.8,
+        "lead_mm": 1.257,
+        "lead_angle_deg": 3.35,
+        "addendum_mm": 0.4,
+        "dedendum_mm": 0.5,
+        "thread_thickness_mm": 0.628,
+        "hand": "right",
+        "profile_shift": 0.0,
+
+        # Worm type (optional)
+        "type": "globoid",  # "cylindrical" or "globoid"
+
+        # Globoid-specific (only if type="globoid")
+        "throat_reduction_mm": 0.05,
+        "throat_curvature_radius_mm": 3.0,
+
+        # Geometry override (optional)
+        "length_mm": 6.0  # If omitted, CLI uses default
+    },
+
+    "wheel": {
+        # Core dimensions (required)
+        "module_mm": 0.4,
+        "num_teeth": 15,
+        "pitch_diameter_mm": 6.0,
+        "tip_diameter_mm": 6.8,
+        "root_diameter_mm": 5.1,
+        "throat_diameter_mm": 6.4,
+        "helix_angle_deg": 86.65,
+        "addendum_mm": 0.4,
+        "dedendum_mm": 0.45,
+        "profile_shift": 0.0,
+
+        # Geometry override (optional)
+        "width_mm": 1.5  # If omitted, auto-calculated
+    },
+
+    "assembly": {
+        "centre_distance_mm": 6.35,
+        "pressure_angle_deg": 20.0,
+        "backlash_mm": 0.02,
+        "hand": "right",
+        "ratio": 15,
+        "efficiency_percent": None,
+        "self_locking": False
+    },
+
+    # Optional: Manufacturing features (separate section - Option B)
+    "features": {
+        "worm": {
+            "bore_diameter_mm": 2.0,
+            "anti_rotation": "ddcut",  # "none" | "DIN6885" | "ddcut"
+            "ddcut_depth_percent": 15.0,  # Only if anti_rotation="ddcut"
+            "set_screw": {
+                "size": "M2",
+                "count": 1
+            }
+        },
+        "wheel": {
+            "bore_diameter_mm": 2.0,
+            "anti_rotation": "DIN6885",  # Standard keyway
+            "set_screw": None,
+            "hub": {
+                "type": "flush",  # "flush", "extended", "flanged"
+                "length_mm": None,
+                "flange_diameter_mm": None,
+                "flange_thickness_mm": None,
+                "bolt_holes": None,
+                "bolt_diameter_mm": None
+            }
+        }
+    },
+
+    # Optional: Manufacturing parameters
+    "manufacturing": {
+        "profile": "ZA",  # "ZA" (straight), "ZK" (circular arc), "ZI" (involute)
+        "virtual_hobbing": False,  # Use virtual hobbing simulation
+        "hobbing_steps": 18,  # Number of hobbing steps
+        "throated_wheel": False,  # Throated/hobbed wheel style
+        "sections_per_turn": 36  # Smoothness parameter
+    }
+}
+
+
+def create_example_schema_v1() -> dict:
+    """
+    Create an example JSON file with all fields documented (Option B format).
+
+    This can be used as a template by the calculator.
+    """
+    example = copy.deepcopy(_EXAMPLE_TEMPLATE_V1)
+    example["_created"] = datetime.now().isoformat()
+    return example
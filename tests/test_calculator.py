@@ -309,6 +309,39 @@ class TestManufacturingParams:
         assert design.manufacturing.throated_wheel is True
 
 
+class TestGloboidThroatRadii:
+    """Tests for calculate_globoid_throat_radii helper function."""
+
+    def test_known_values(self):
+        """Throat pitch radius is centre distance minus wheel pitch radius."""
+        from wormgear.calculator.core import calculate_globoid_throat_radii
+
+        pitch_r, tip_r, root_r = calculate_globoid_throat_radii(
+            centre_distance_mm=40.0,
+            wheel_pitch_diameter_mm=60.0,
+            addendum_mm=2.0,
+            dedendum_mm=2.5,
+        )
+
+        assert pitch_r == pytest.approx(10.0)
+        assert tip_r == pytest.approx(12.0)
+        assert root_r == pytest.approx(7.5)
+
+    def test_broadcasts_over_arrays(self):
+        """Array inputs evaluate a sweep elementwise (matches scalar calls)."""
+        np = pytest.importorskip("numpy")
+        from wormgear.calculator.core import calculate_globoid_throat_radii
+
+        centre_distances = np.array([30.0, 40.0, 50.0])
+        pitch_r, tip_r, root_r = calculate_globoid_throat_radii(
+            centre_distances, 60.0, 2.0, 2.5
+        )
+
+        for i, cd in enumerate(centre_distances):
+            expected = calculate_globoid_throat_radii(float(cd), 60.0, 2.0, 2.5)
+            assert (pitch_r[i], tip_r[i], root_r[i]) == pytest.approx(expected)
+
+
 class TestThroatOD:
     """Tests for calculate_throat_od helper function."""
 
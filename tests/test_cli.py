@@ -39,6 +39,44 @@ class TestCLIEntryPoints:
         result = run_wormgear_cli("--help")
         assert result.returncode == 0
 
+    def test_cli_module_import_does_not_load_build123d(self):
+        """Importing the CLI (as ``--help`` does) must not pull in build123d."""
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys\n"
+                "import wormgear.cli.generate\n"
+                "assert 'build123d' not in sys.modules, 'build123d imported eagerly'\n"
+                "assert 'pydantic' not in sys.modules, 'pydantic imported eagerly'\n"
+                "print('OK')\n",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.returncode == 0, (
+            f"stdout: {result.stdout}\nstderr: {result.stderr}"
+        )
+        assert "OK" in result.stdout
+
+    def test_version_string_only_computed_for_version_flag(self, capsys):
+        """Building the parser must not shell out to git; ``-V`` still does."""
+        from unittest.mock import patch
+
+        from wormgear.cli import generate
+
+        with patch.object(generate, "get_version_string", return_value="9.9.9") as get_version:
+            parser = generate._build_arg_parser()
+            parser.parse_args(["design.json"])
+            get_version.assert_not_called()
+
+            with pytest.raises(SystemExit) as exc_info:
+                parser.parse_args(["-V"])
+            assert exc_info.value.code == 0
+            get_version.assert_called_once()
+
+        assert "9.9.9" in capsys.readouterr().out
+
 
 class TestCLIBasic:
     """Basic CLI tests."""
@@ -62,6 +100,12 @@ class TestCLIBasic:
         result = run_wormgear_cli(str(invalid_file), "--no-save")
         assert result.returncode != 0
 
+    def test_cli_worm_only_and_wheel_only_conflict(self):
+        """--worm-only with --wheel-only is a usage error (would generate nothing)."""
+        result = run_wormgear_cli("design.json", "--worm-only", "--wheel-only")
+        assert result.returncode == 2
+        assert "not allowed with" in result.stderr
+
 
 class TestCLIGeneration:
     """Tests for geometry generation via CLI."""
@@ -138,6 +138,16 @@ class TestDIN6885Lookup:
         assert get_din_6885_keyway(5.0) is None
         assert get_din_6885_keyway(100.0) is None
 
+    def test_lookup_matches_table_at_every_boundary(self):
+        """Bisect lookup agrees with the DIN_6885_KEYWAYS ranges at each edge."""
+        from wormgear.core.features import DIN_6885_KEYWAYS
+
+        for (min_d, max_d), dims in DIN_6885_KEYWAYS.items():
+            assert get_din_6885_keyway(float(min_d)) == dims
+            assert get_din_6885_keyway(max_d - 0.01) == dims
+        assert get_din_6885_keyway(95.0) is None
+        assert get_din_6885_keyway(float("nan")) is None
+
 
 class TestCalculateDefaultBore:
     """Tests for calculate_default_bore function."""
@@ -108,6 +108,31 @@ class TestLoadDesignJson:
         with pytest.raises(json.JSONDecodeError):
             load_design_json(invalid_file)
 
+    def test_load_without_orjson(self, temp_json_file, monkeypatch):
+        """Test that the stdlib json fallback gives the same design."""
+        pytest.importorskip("orjson")
+        from wormgear.io import loaders
+
+        accelerated = load_design_json(temp_json_file)
+        monkeypatch.setattr(loaders, "_orjson", None)
+        fallback = load_design_json(temp_json_file)
+
+        assert fallback == accelerated
+
+    def test_round_trip_non_finite_float(self, temp_json_file, tmp_path, monkeypatch):
+        """Test that NaN written by save_design_json loads with or without orjson."""
+        import math
+        from wormgear.io import loaders
+
+        design = load_design_json(temp_json_file)
+        design.worm.length_mm = float("nan")
+        saved = tmp_path / "non_finite.json"
+        save_design_json(design, saved)
+
+        assert math.isnan(load_design_json(saved).worm.length_mm)
+        monkeypatch.setattr(loaders, "_orjson", None)
+        assert math.isnan(load_design_json(saved).worm.length_mm)
+
     def test_load_missing_required_field(self, tmp_path, sample_design_7mm):
         """Test that missing required fields raise an error."""
         from pydantic import ValidationError
@@ -425,6 +450,38 @@ class TestSchemaMigration:
         assert result["schema_version"] == "2.0"
         assert result["features"]["worm"]["bore_type"] == "auto"
 
+    def test_upgrade_schema_current_returns_copy(self):
+        """Test that an already-current document is still returned as a new dict."""
+        from wormgear.io.schema import upgrade_schema
+
+        data = {"schema_version": "2.0", "worm": {"hand": "right"}, "wheel": {}, "assembly": {}}
+
+        result = upgrade_schema(data, "2.0")
+        assert result == data
+        assert result is not data
+
+        result["worm"]["hand"] = "left"
+        assert data["worm"]["hand"] == "right"
+
+    def test_upgrade_schema_does_not_mutate_input(self):
+        """Test that migrating returns a new dict and leaves the input alone."""
+        from wormgear.io.schema import upgrade_schema
+
+        old_data = {
+            "schema_version": "1.0",
+            "worm": {"hand": "RIGHT"},
+            "wheel": {},
+            "assembly": {},
+            "manufacturing": {"worm_features": {"bore_type": "auto"}},
+        }
+
+        migrated = upgrade_schema(old_data, "2.0")
+
+        assert migrated is not old_data
+        assert old_data["schema_version"] == "1.0"
+        assert old_data["worm"]["hand"] == "RIGHT"
+        assert "worm_features" in old_data["manufacturing"]
+
     def test_upgrade_schema_migrates_features(self):
         """Test that features in manufacturing are migrated to features section."""
         from wormgear.io.schema import upgrade_schema
@@ -456,6 +513,25 @@ class TestSchemaMigration:
         # profile should remain in manufacturing
         assert migrated["manufacturing"]["profile"] == "ZA"
 
+    def test_upgrade_schema_keeps_non_dict_features(self):
+        """Test that a malformed features section is not replaced during migration."""
+        from wormgear.io.schema import upgrade_schema
+
+        for features in (None, ["worm"]):
+            old_data = {
+                "schema_version": "1.0",
+                "worm": {},
+                "wheel": {},
+                "assembly": {},
+                "features": features,
+                "manufacturing": {"worm_features": {"bore_type": "auto"}},
+            }
+
+            migrated = upgrade_schema(old_data, "2.0")
+
+            assert migrated["features"] == features
+            assert migrated["manufacturing"]["worm_features"] == {"bore_type": "auto"}
+
     def test_upgrade_schema_normalizes_hand(self):
         """Test that hand enum values are normalized to lowercase."""
         from wormgear.io.schema import upgrade_schema
@@ -548,3 +624,177 @@ class TestSchemaMigration:
         # The fields should not exist on the model
         assert not hasattr(params, 'worm_features') or params.worm_features is None
         assert not hasattr(params, 'wheel_features') or params.wheel_features is None
+
+
+class TestValidateJsonSchema:
+    """Tests for the lightweight validate_json_schema helper."""
+
+    def test_missing_sections_reported(self):
+        """Test that each missing required section produces an error."""
+        from wormgear.io.schema import validate_json_schema
+
+        result = validate_json_schema({"schema_version": "2.1", "worm": {}})
+
+        assert result["valid"] is False
+        assert "Missing required section: 'wheel'" in result["errors"]
+        assert "Missing required section: 'assembly'" in result["errors"]
+
+    def test_invalid_anti_rotation_rejected(self):
+        """Test that unknown anti_rotation values are rejected per part."""
+        from wormgear.io.schema import validate_json_schema
+
+        data = {
+            "schema_version": "2.1",
+            "worm": {},
+            "wheel": {},
+            "assembly": {},
+            "features": {
+                "worm": {"anti_rotation": "DIN6885"},
+                "wheel": {"anti_rotation": "spline"},
+            },
+        }
+
+        result = validate_json_schema(data)
+
+        assert result["valid"] is False
+        assert len(result["errors"]) == 1
+        assert "'spline' for wheel" in result["errors"][0]
+        assert "none, DIN6885, ddcut" in result["errors"][0]
+
+    def test_unhashable_anti_rotation_rejected(self):
+        """Test that list/dict anti_rotation values are reported, not raised."""
+        from wormgear.io.schema import is_valid_json_schema, validate_json_schema
+
+        for bad_value in (["ddcut"], {"type": "ddcut"}):
+            data = {
+                "schema_version": "2.1",
+                "worm": {},
+                "wheel": {},
+                "assembly": {},
+                "features": {"worm": {"anti_rotation": bad_value}},
+            }
+
+            result = validate_json_schema(data)
+
+            assert result["valid"] is False
+            assert len(result["errors"]) == 1
+            assert "Invalid anti_rotation value" in result["errors"][0]
+            assert is_valid_json_schema(data) is False
+
+    def test_example_schema_is_fresh_copy(self):
+        """Test that create_example_schema_v1 never hands out shared state."""
+        from wormgear.io.schema import create_example_schema_v1
+
+        first = create_example_schema_v1()
+        first["worm"]["module_mm"] = 99.0
+        first["features"]["worm"]["set_screw"]["count"] = 3
+
+        second = create_example_schema_v1()
+        assert second["worm"]["module_mm"] == 0.4
+        assert second["features"]["worm"]["set_screw"]["count"] == 1
+        assert isinstance(second["_created"], str)
+
+    def test_ddcut_without_depth_warns(self):
+        """Test that ddcut anti-rotation without a depth only warns."""
+        from wormgear.io.schema import validate_json_schema
+
+        data = {
+            "schema_version": "2.1",
+            "worm": {},
+            "wheel": {},
+            "assembly": {},
+            "features": {"worm": {"anti_rotation": "ddcut"}, "wheel": None},
+        }
+
+        result = validate_json_schema(data)
+
+        assert result["valid"] is True
+        assert result["warnings"] == [
+            "worm.anti_rotation='ddcut' but ddcut_depth_percent not specified "
+            "(will use default 15%)"
+        ]
+
+    def test_iter_validate_designs_streams_array(self, tmp_path):
+        """Test that each element of a bulk design array is validated in order."""
+        pytest.importorskip("ijson")
+        from wormgear.io.schema import iter_validate_designs
+
+        designs = [
+            {"schema_version": "2.1", "worm": {}, "wheel": {}, "assembly": {}},
+            {"schema_version": "2.1", "worm": {"module_mm": 1.5}},
+        ]
+        bulk_file = tmp_path / "bulk.json"
+        bulk_file.write_text(json.dumps(designs))
+
+        results = list(iter_validate_designs(bulk_file))
+
+        assert [r["valid"] for r in results] == [True, False]
+        assert "Missing required section: 'wheel'" in results[1]["errors"]
+
+    def test_schema_import_does_not_load_examples(self):
+        """Test that the example template is only imported on demand."""
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys\n"
+                "import wormgear.io.schema as schema\n"
+                "assert 'wormgear.io.schema_examples' not in sys.modules\n"
+                "schema.create_example_schema_v1()\n"
+                "assert 'wormgear.io.schema_examples' in sys.modules\n",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_is_valid_json_schema_matches_full_validation(self):
+        """Test that the short-circuit check agrees with validate_json_schema."""
+        from wormgear.io.schema import is_valid_json_schema, validate_json_schema
+
+        good = {"worm": {}, "wheel": {}, "assembly": {}}
+        bad = {"worm": {}, "features": {"worm": {"anti_rotation": "spline"}}}
+
+        assert is_valid_json_schema(good) is True
+        assert is_valid_json_schema(bad) is False
+        assert validate_json_schema(good)["valid"] is True
+        assert validate_json_schema(bad)["valid"] is False
+
+
+class TestWriteAtomic:
+    """Tests for the atomic file writer used by save_package_to_dir."""
+
+    def test_write_replaces_contents(self, tmp_path):
+        """Test that a successful write replaces the target and removes the temp file."""
+        pytest.importorskip("build123d")
+        from wormgear.io.package import _write_atomic
+
+        target = tmp_path / "worm.step"
+        target.write_bytes(b"old")
+
+        _write_atomic(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failed_write_keeps_old_contents(self, tmp_path, monkeypatch):
+        """Test that a failing write leaves the target intact and no temp file behind."""
+        pytest.importorskip("build123d")
+        from wormgear.io import package
+
+        target = tmp_path / "worm.step"
+        target.write_bytes(b"old")
+
+        def failing_replace(src, dst):
+            raise OSError("simulated failure")
+
+        monkeypatch.setattr(package.os, "replace", failing_replace)
+
+        with pytest.raises(OSError, match="simulated failure"):
+            package._write_atomic(target, b"new")
+
+        assert target.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [target]
@@ -360,6 +360,74 @@ class TestValidateDesignJson:
         assert not is_valid
         assert any("bore_diameter_mm" in e and "positive" in e for e in errors)
 
+    def test_invalid_anti_rotation(self):
+        """Unknown anti_rotation values should fail and list the choices."""
+        data = {
+            "worm": {
+                "module_mm": 2.0,
+                "num_starts": 1,
+                "pitch_diameter_mm": 16.0,
+                "tip_diameter_mm": 20.0,
+                "root_diameter_mm": 11.0,
+                "lead_mm": 6.283,
+                "lead_angle_deg": 7.0,
+                "addendum_mm": 2.0,
+                "dedendum_mm": 2.5,
+                "thread_thickness_mm": 3.14,
+                "hand": "right",
+            },
+            "wheel": {
+                "module_mm": 2.0,
+                "num_teeth": 30,
+                "pitch_diameter_mm": 60.0,
+                "tip_diameter_mm": 64.0,
+                "root_diameter_mm": 55.0,
+                "throat_diameter_mm": 62.0,
+                "helix_angle_deg": 83.0,
+                "addendum_mm": 2.0,
+                "dedendum_mm": 2.5,
+            },
+            "assembly": {
+                "centre_distance_mm": 38.0,
+                "pressure_angle_deg": 20.0,
+                "backlash_mm": 0.05,
+                "ratio": 30.0,
+                "hand": "right",
+            },
+            "features": {
+                "worm": {"anti_rotation": "DIN6885"},
+                "wheel": {"anti_rotation": "spline"},  # Invalid
+            },
+        }
+        is_valid, errors = validate_design_json(data)
+        assert not is_valid
+        assert errors == [
+            "features.wheel.anti_rotation must be one of ['none', 'DIN6885', 'DD-cut']"
+        ]
+
+    @pytest.mark.parametrize("bad_value", [["right"], {"value": "right"}])
+    def test_unhashable_enum_values_reported(self, bad_value):
+        """List/dict values for enum fields should produce errors, not raise."""
+        data = {
+            "worm": {"hand": bad_value},
+            "wheel": {},
+            "assembly": {"hand": "right", "profile": bad_value},
+            "manufacturing": {"worm_type": bad_value, "profile": bad_value},
+            "features": {"worm": {"anti_rotation": bad_value}},
+        }
+        is_valid, errors = validate_design_json(data)
+        assert not is_valid
+        assert f"worm.'hand' must be 'right' or 'left', got '{bad_value}'" in errors
+        assert f"assembly.'profile' must be 'ZA', 'ZK', or 'ZI', got '{bad_value}'" in errors
+        assert (
+            f"manufacturing.'worm_type' must be 'cylindrical' or 'globoid', got '{bad_value}'"
+            in errors
+        )
+        assert f"manufacturing.'profile' must be 'ZA', 'ZK', or 'ZI', got '{bad_value}'" in errors
+        assert (
+            "features.worm.anti_rotation must be one of ['none', 'DIN6885', 'DD-cut']" in errors
+        )
+
 
 class TestValidateAndRaise:
     """Test validate_and_raise function."""
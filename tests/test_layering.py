@@ -17,6 +17,8 @@ Rules enforced:
   4. ``wormgear.calculator`` MUST work without ``build123d`` installed
      (the Pyodide story for wormgear.studio).
   5. ``wormgear.calculator.js_bridge`` MUST work without ``build123d``.
+  6. ``import wormgear.core`` MUST NOT import ``build123d`` eagerly; geometry
+     names are resolved on first access.
 
 The static checks deliberately allow function-level (lazy) imports — those
 are the architecturally correct pattern for optional/conditional features,
@@ -309,3 +311,65 @@ class TestCalculatorRunsWithoutBuild123d:
             f"stdout: {result.stdout}\nstderr: {result.stderr}"
         )
         assert "OK" in result.stdout
+
+
+# ---------------------------------------------------------------------------
+# Rule 6: importing wormgear.core does not pull in build123d eagerly
+# ---------------------------------------------------------------------------
+
+
+class TestCoreImportIsLazy:
+    """``wormgear.core`` resolves its geometry exports on first access (PEP 562)."""
+
+    def test_core_import_does_not_load_build123d(self):
+        """A bare ``import wormgear.core`` must not import build123d."""
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys\n"
+                "import wormgear.core\n"
+                "from wormgear.core import calculate_default_bore\n"
+                "assert 'build123d' not in sys.modules, 'build123d imported eagerly'\n"
+                "print('OK')\n",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.returncode == 0, (
+            f"wormgear.core import was not lazy.\n"
+            f"stdout: {result.stdout}\nstderr: {result.stderr}"
+        )
+        assert "OK" in result.stdout
+
+    def test_removed_names_still_give_migration_hint(self):
+        """Lazy ``__getattr__`` keeps the #200 migration ImportError."""
+        result = _run_python_without_build123d(
+            "try:\n"
+            "    from wormgear.core import WormGeometry\n"
+            "except ImportError as e:\n"
+            "    assert 'wormgear.WormGear' in str(e), str(e)\n"
+            "    print('OK')\n"
+        )
+        assert result.returncode == 0, (
+            f"stdout: {result.stdout}\nstderr: {result.stderr}"
+        )
+        assert "OK" in result.stdout
+
+    def test_geometry_names_are_missing_attributes_without_build123d(self):
+        """Without build123d, lazy geometry names raise AttributeError, not ImportError."""
+        result = _run_python_without_build123d(
+            "import wormgear\n"
+            "import wormgear.core\n"
+            "assert not hasattr(wormgear.core, 'BoreFeature')\n"
+            "assert not hasattr(wormgear, 'BoreFeature')\n"
+            "try:\n"
+            "    wormgear.core.BoreFeature\n"
+            "except AttributeError as e:\n"
+            "    assert 'requires build123d' in str(e), str(e)\n"
+            "    print('OK')\n"
+        )
+        assert result.returncode == 0, (
+            f"stdout: {result.stdout}\nstderr: {result.stderr}"
+        )
+        assert "OK" in result.stdout
@@ -22,6 +22,7 @@ from wormgear.calculator.validation import (
     _validate_worm_proportions,
     _validate_pressure_angle,
     _validate_clearance,
+    worm_wheel_clearance,
     _validate_centre_distance,
     _validate_profile,
     _validate_worm_type,
@@ -445,6 +446,16 @@ class TestValidateClearance:
         codes = _codes(_validate_clearance(design))
         assert 'CLEARANCE_VERY_SMALL' in codes
 
+    def test_clearance_kernel_matches_hand_calculation(self):
+        # clearance = 38.14 - 21.24/2 - 55/2 = 0.02
+        assert worm_wheel_clearance(38.14, 21.24, 55.0) == pytest.approx(0.02)
+
+    def test_clearance_kernel_throat_reduction(self):
+        # Globoid throat pulls the effective tip radius in by the reduction
+        plain = worm_wheel_clearance(38.14, 21.24, 55.0)
+        globoid = worm_wheel_clearance(38.14, 21.24, 55.0, throat_reduction_mm=0.3)
+        assert globoid - plain == pytest.approx(0.3)
+
 
 # ===========================================================================
 # 10. TestValidateCentreDistance